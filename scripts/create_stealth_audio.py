@@ -34,8 +34,8 @@ def create_stealth_file(
     logger.info(f"Loading host audio: {input_path}")
     try:
         # returns data, samplerate
-        data, fs = sf.read(input_path)
-        logger.info(f"Loaded audio: {data.shape}, dtype={data.dtype}, range=[{np.min(data):.3f}, {np.max(data):.3f}]")
+        # float32 directly: the encoder works in float32 anyway (no float64 intermediate)
+        data, fs = sf.read(input_path, dtype="float32")
     except Exception as e:
         logger.error(f"Failed to read input file: {e}")
         return
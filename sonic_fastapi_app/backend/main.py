@@ -37,6 +37,10 @@ rx = SonicReceiver(sample_rate=TARGET_FS)
 BUFFER_DURATION = 1.0  # Optimized for fast 0.3s packets
 BUFFER_SIZE = int(TARGET_FS * BUFFER_DURATION)
 
+# Largest batch the DSP worker drains before decoding: well below BUFFER_SIZE so a backlog
+# never pushes unsearched samples out of the sliding window (the rest waits in the queue)
+MAX_BATCH_SAMPLES = BUFFER_SIZE // 2
+
 # --- Threaded DSP Architecture ---
 audio_queue: queue.Queue = queue.Queue()
 processing_active: bool = False
@@ -46,6 +50,46 @@ active_connections: list[WebSocket] = []
 main_loop = None
 
 
+class SlidingAudioBuffer:
+    """
+    Keeps the last `size` samples in a preallocated array of twice that size.
+    Appending copies only the new samples (live data is moved back to the front
+    once per `size` appended samples), and view() is a contiguous slice, not a copy.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._data = np.zeros(2 * size, dtype=np.float32)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def append(self, chunk: np.ndarray):
+        # Only the newest `size` samples can survive the sliding window
+        chunk = chunk[-self.size :]
+        n = len(chunk)
+
+        # Drop the oldest samples to fit the window
+        self._start = max(self._start, self._end + n - self.size)
+
+        # No room at the tail: move the live samples back to the front
+        if self._end + n > len(self._data):
+            live = self._end - self._start
+            self._data[:live] = self._data[self._start : self._end]
+            self._start, self._end = 0, live
+
+        self._data[self._end : self._end + n] = chunk
+        self._end += n
+
+    def consume(self, n: int):
+        self._start = min(self._start + n, self._end)
+
+    def view(self) -> np.ndarray:
+        return self._data[self._start : self._end]
+
+
 def audio_processing_worker():
     """
     Background thread that consumes audio chunks and runs the heavy DSP decoding.
@@ -53,13 +97,26 @@ def audio_processing_worker():
     global processing_active
     logger.info("DSP Worker Thread Started")
 
-    # Local buffer for the worker
-    worker_buffer = np.zeros(0, dtype=np.float32)
+    # Local buffer for the worker (sliding window over the last BUFFER_SIZE samples)
+    worker_buffer = SlidingAudioBuffer(BUFFER_SIZE)
 
     while processing_active:
         try:
             # Get data from queue
-            chunk = audio_queue.get(timeout=1.0)
+            chunks = [audio_queue.get(timeout=1.0)]
+
+            # Drain the blocks that queued up while the last decode was running:
+            # one buffer update and one decode attempt per batch instead of per block,
+            # capped at MAX_BATCH_SAMPLES so a long backlog is decoded over several passes
+            batch_samples = len(chunks[0])
+            while batch_samples < MAX_BATCH_SAMPLES:
+                try:
+                    chunks.append(audio_queue.get_nowait())
+                except queue.Empty:
+                    break
+                batch_samples += len(chunks[-1])
+
+            chunk = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
 
             # RMS Level Check
             # rms = np.sqrt(np.mean(chunk**2))
@@ -70,21 +127,18 @@ def audio_processing_worker():
                 logger.warning(f"Input Clipping Detected! Max: {max_amp:.2f}")
 
             # Append to worker buffer (Thread Safe-ish, as only one producer/consumer)
-            worker_buffer = np.concatenate((worker_buffer, chunk))
-
-            # Sliding Window Management
-            if len(worker_buffer) > BUFFER_SIZE:
-                worker_buffer = worker_buffer[-BUFFER_SIZE:]
+            # Sliding Window Management: oldest samples beyond BUFFER_SIZE are dropped
+            worker_buffer.append(chunk)
 
             # Attempt Decode
             try:
                 # Heavy Blocking Call
                 # Now returns (payload, consumed_samples)
-                decoded_payload, consumed = rx.decode_frame(worker_buffer)
+                decoded_payload, consumed = rx.decode_frame(worker_buffer.view())
 
                 # Correctly advance buffer
                 if consumed > 0:
-                    worker_buffer = worker_buffer[consumed:]
+                    worker_buffer.consume(consumed)
 
                 if decoded_payload:
                     message = json.loads(decoded_payload.decode("utf-8"))
@@ -97,7 +151,8 @@ def audio_processing_worker():
             except Exception:
                 logger.debug("Decode failed")
 
-            audio_queue.task_done()
+            for _ in chunks:
+                audio_queue.task_done()
 
         except queue.Empty:
             continue
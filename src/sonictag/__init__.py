@@ -1,7 +1,11 @@
-from importlib.metadata import PackageNotFoundError, version
-
 try:
-    __version__ = version("sonictag")
-except PackageNotFoundError:
-    # Si le package n'est pas installé (ex: test en local)
-    __version__ = "unknown"
+    # Écrit par le hook de build hatchling : évite de parcourir les métadonnées à chaque import
+    from ._version import __version__
+except ImportError:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        __version__ = version("sonictag")
+    except PackageNotFoundError:
+        # Si le package n'est pas installé (ex: test en local)
+        __version__ = "unknown"
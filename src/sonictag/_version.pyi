@@ -0,0 +1,2 @@
+# Type stub for the module written by the hatch build hook (see [tool.hatch.build.hooks.version])
+__version__: str
@@ -1,7 +1,25 @@
 import struct
 import zlib
+from functools import lru_cache
 
-from reedsolo import ReedSolomonError, RSCodec  # type: ignore
+try:
+    # Cython build of reedsolo (same API, much faster encode/decode) when it was compiled
+    from creedsolo import ReedSolomonError, RSCodec  # type: ignore
+except ImportError:
+    from reedsolo import ReedSolomonError, RSCodec  # type: ignore
+
+# Packet header: [ Length (ushort) | CRC32 (uint) | Inverted Length (ushort) ], compiled once
+_HEADER = struct.Struct("!HIH")
+
+
+@lru_cache(maxsize=8)
+def _get_codec(ec_bytes: int) -> RSCodec:
+    """
+    Returns a shared RSCodec for ec_bytes.
+    The codec only holds precomputed Galois field tables and generator polynomials,
+    so every handler (Transmitter, Receiver, ...) can reuse the same instance.
+    """
+    return RSCodec(ec_bytes)
 
 
 class SonicDataHandler:
@@ -18,7 +36,7 @@ class SonicDataHandler:
                          Decoder can correct ec_bytes/2 errors.
         """
         self.ec_bytes = ec_bytes
-        self.rsc = RSCodec(ec_bytes)
+        self.rsc = _get_codec(ec_bytes)
 
     def encode(self, payload: bytes) -> bytes:
         """
@@ -32,7 +50,8 @@ class SonicDataHandler:
         """
 
         # 1. RS Encode
-        encoded_payload = bytes(self.rsc.encode(payload))
+        # bytearray input: the Cython codec needs a writable buffer
+        encoded_payload = bytes(self.rsc.encode(bytearray(payload)))
 
         # 2. Calculate CRC32 of the ENCODED payload (to check integrity after demodulation)
         crc = zlib.crc32(encoded_payload) & 0xFFFFFFFF
@@ -45,7 +64,7 @@ class SonicDataHandler:
         inv_length = (~length) & 0xFFFF
 
         # Struct format: H (ushort, 2), I (uint, 4), H (ushort, 2 - inv_length)
-        header = struct.pack("!HIH", length, crc, inv_length)
+        header = _HEADER.pack(length, crc, inv_length)
 
         return header + encoded_payload
 
@@ -55,13 +74,13 @@ class SonicDataHandler:
         Expects the format: [Header] [EncodedPayload]
         Returns the original payload or raises ReedSolomonError/ValueError.
         """
-        header_size = struct.calcsize("!HIH")
+        header_size = _HEADER.size
         if len(data_stream) < header_size:
             raise ValueError("Data stream too short for header")
 
         # 1. Parse Header
         header = data_stream[:header_size]
-        length, crc, inv_length = struct.unpack("!HIH", header)
+        length, crc, inv_length = _HEADER.unpack(header)
 
         # Robustness Check 1: Inverted Checksum
         # Check: (length ^ inv_length) should be 0xFFFF (all 1s)
@@ -81,14 +100,23 @@ class SonicDataHandler:
 
         # 2. Verify CRC
         computed_crc = zlib.crc32(encoded_payload) & 0xFFFFFFFF
-        if computed_crc != crc:
-            # RS fixes errors, then we check integrity.
-            pass
+        if computed_crc == crc:
+            # Intact packet: the RS code is systematic, so just strip the ECC bytes
+            return self._strip_ecc(encoded_payload)
 
-        # 3. RS Decode
+        # 3. RS Decode (only for corrupted packets)
         try:
-            original_payload, _, _ = self.rsc.decode(encoded_payload)
+            original_payload, _, _ = self.rsc.decode(bytearray(encoded_payload))
             return bytes(original_payload)
 
         except ReedSolomonError as e:
             raise e
+
+    def _strip_ecc(self, encoded_payload: bytes) -> bytes:
+        """
+        Returns the message part of an error-free RS stream.
+        RSCodec encodes blocks of (nsize - ec_bytes) message bytes followed by ec_bytes of ECC.
+        """
+        nsize = self.rsc.nsize
+        blocks = (encoded_payload[i : i + nsize] for i in range(0, len(encoded_payload), nsize))
+        return b"".join(block[: len(block) - self.ec_bytes] for block in blocks)
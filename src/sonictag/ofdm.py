@@ -1,4 +1,35 @@
+from functools import lru_cache
+
 import numpy as np
+from scipy import fft
+
+# BPSK Mapping table: bit 0 -> -1, bit 1 -> 1
+_BPSK_SYMBOLS = np.array([-1.0, 1.0], dtype=np.float32)
+
+
+@lru_cache(maxsize=8)
+def _build_reference_frame(n_fft: int, cp_len: int, start_bin: int, end_bin: int, bin_step: int) -> np.ndarray:
+    """
+    Builds the time-domain reference symbol (with CP) used to initialise DBPSK.
+    Cached: every modulator with the same layout (one per Transmitter / Stego encoder)
+    shares the same read-only frame.
+    """
+    active_bins = np.arange(start_bin, end_bin + 1, bin_step)
+
+    # Active values state: init to 1.0 (complex)
+    current_state = np.ones(len(active_bins), dtype=complex)
+
+    # Generate Reference Time Domain
+    # Real output: only the half spectrum is needed, irfft implies the Hermitian mirror
+    ref_freq_data = np.zeros(n_fft // 2 + 1, dtype=np.complex64)
+    ref_freq_data[active_bins] = current_state
+
+    ref_time = fft.irfft(ref_freq_data, n=n_fft)
+    # Add CP
+    ref_frame = np.concatenate([ref_time[-cp_len:], ref_time])
+
+    ref_frame.flags.writeable = False
+    return ref_frame
 
 
 class SonicOFDM:
@@ -38,70 +69,50 @@ class SonicOFDM:
         # For DBPSK, 1 bit per subcarrier
         self.bits_per_symbol = self.n_subcarriers
 
+        # The reference symbol (all phases at 1.0) never changes: build it once
+        self._ref_frame = _build_reference_frame(self.n_fft, self.cp_len, self.start_bin, self.end_bin, self.bin_step)
+
     def modulate(self, bits: np.ndarray) -> np.ndarray:
         """
         Modulate bits into an OFDM time-domain signal using Differential BPSK (DBPSK).
         Robust against phase rotation and channel distortion.
         """
-        # 1. Pad bits
+        # 1. Pad bits and map them to BPSK symbols in one preallocated buffer
+        # Padding bits are 0, i.e. -1 after mapping
         n_bits = len(bits)
-        padding = (self.bits_per_symbol - (n_bits % self.bits_per_symbol)) % self.bits_per_symbol
-        if padding > 0:
-            bits = np.concatenate([bits, np.zeros(padding, dtype=int)])
-
-        n_symbols = len(bits) // self.bits_per_symbol
+        n_symbols = -(-n_bits // self.bits_per_symbol)
 
-        time_signal = []
+        data_symbols = np.full(n_symbols * self.bits_per_symbol, -1.0, dtype=np.float32)
+        # BPSK Mapping: 0 -> -1, 1 -> 1 (table lookup written straight into the buffer)
+        np.take(_BPSK_SYMBOLS, bits, out=data_symbols[:n_bits])
+        symbol_matrix = data_symbols.reshape(n_symbols, self.bits_per_symbol)
 
-        # 2. Reference Symbol
-        # Active values state: init to 1.0 (complex)
-        current_state = np.ones(self.n_subcarriers, dtype=complex)
-
-        # Generate Reference Time Domain
-        ref_freq_data = np.zeros(self.n_fft, dtype=complex)
-        ref_freq_data[self.active_bins] = current_state
-        # Conjugate symmetry for Real output
-        for idx, bin_idx in enumerate(self.active_bins):
-            ref_freq_data[self.n_fft - bin_idx] = np.conj(current_state[idx])
-
-        ref_time = np.fft.ifft(ref_freq_data)
-        ref_time = np.real(ref_time)
-        # Add CP
-        ref_with_cp = np.concatenate([ref_time[-self.cp_len :], ref_time])
-        time_signal.append(ref_with_cp)
-
-        # 3. Differential Modulation
-        for i in range(n_symbols):
-            chunk = bits[i * self.bits_per_symbol : (i + 1) * self.bits_per_symbol]
-
-            # BPSK Mapping: 0 -> -1, 1 -> 1
-            # Differential Encoding: NewState = OldState * Symbol
-            # If bit 1 (1): New = Old * 1 = Old (No Change)
-            # If bit 0 (-1): New = Old * -1 = -Old (Phase Flip)
-            # This is standard differential encoding logic.
-
-            data_symbols = 2 * chunk - 1  # Map 0,1 to -1,1
-
-            # Update State
-            current_state = current_state * data_symbols
+        # Preallocate the whole frame: [Ref] [Sym 1] ... [Sym N], each with CP
+        symbol_len = self.n_fft + self.cp_len
+        # float32 end to end (complex64 spectra): audio needs no more precision
+        full_signal = np.empty((n_symbols + 1) * symbol_len, dtype=np.float32)
 
-            # Create Freq Data
-            freq_data = np.zeros(self.n_fft, dtype=complex)
-            freq_data[self.active_bins] = current_state
+        # 2. Reference Symbol (precomputed, see _build_reference_frame)
+        full_signal[:symbol_len] = self._ref_frame
 
-            # Hermitian Symmetry
-            for idx, bin_idx in enumerate(self.active_bins):
-                freq_data[self.n_fft - bin_idx] = np.conj(current_state[idx])
+        # 3. Differential Modulation (all symbols at once)
+        # Differential Encoding: NewState = OldState * Symbol, starting from the all-ones reference
+        # If bit 1 (1): New = Old * 1 = Old (No Change)
+        # If bit 0 (-1): New = Old * -1 = -Old (Phase Flip)
+        # The running product over symbols is exactly np.cumprod along axis 0.
+        states = np.cumprod(symbol_matrix, axis=0)
 
-            # IFFT
-            symbol_time = np.fft.ifft(freq_data)
-            symbol_time = np.real(symbol_time)
+        # Create Freq Data: one half spectrum row per symbol
+        freq_data = np.zeros((n_symbols, self.n_fft // 2 + 1), dtype=np.complex64)
+        freq_data[:, self.active_bins] = states
 
-            # Add CP
-            with_cp = np.concatenate([symbol_time[-self.cp_len :], symbol_time])
-            time_signal.append(with_cp)
+        # IFFT (Hermitian symmetry implied by irfft: real output)
+        symbols_time = fft.irfft(freq_data, n=self.n_fft, axis=1, workers=-1)
 
-        full_signal = np.concatenate(time_signal)
+        # Add CP, written straight into the frame through a 2D view
+        frame = full_signal[symbol_len:].reshape(n_symbols, symbol_len)
+        frame[:, : self.cp_len] = symbols_time[:, -self.cp_len :]
+        frame[:, self.cp_len :] = symbols_time
 
         # Normalize
         max_val = np.max(np.abs(full_signal))
@@ -118,45 +129,29 @@ class SonicOFDM:
         n_symbols_total = len(signal) // symbol_len
 
         if n_symbols_total < 2:
-            return np.array([], dtype=int)  # Need at least reference + 1 symbol
-
-        all_bits = []
-
-        # 1. Extract Reference Symbol
-        # Skip CP
-        ref_start = self.cp_len
-        ref_end = symbol_len
-        ref_chunk = signal[ref_start:ref_end]
-        ref_fft = np.fft.fft(ref_chunk, n=self.n_fft)
-        prev_response = ref_fft[self.active_bins]
-
-        # 2. Loop Data Symbols
-        # Start from index 1 (0 was reference)
-        for i in range(1, n_symbols_total):
-            start = i * symbol_len + self.cp_len
-            end = (i + 1) * symbol_len
-            chunk = signal[start:end]
-
-            # FFT
-            fft_data = np.fft.fft(chunk, n=self.n_fft)
-            curr_response = fft_data[self.active_bins]
+            return np.array([], dtype=np.uint8)  # Need at least reference + 1 symbol
 
-            # DBPSK Demodulation
-            # diff = curr * conj(prev)
-            # If phase didn't change (1): curr ~= prev => curr * conj(prev) ~= |prev|^2 (Real Positive)
-            # If phase flipped (-1): curr ~= -prev => curr * conj(prev) ~= -|prev|^2 (Real Negative)
+        # 1. Cut into symbols and skip each CP (one 2D view instead of per-symbol slices)
+        # Row 0 is the Reference Symbol
+        symbols = signal[: n_symbols_total * symbol_len].reshape(n_symbols_total, symbol_len)[:, self.cp_len :]
 
-            diff = curr_response * np.conj(prev_response)
+        # 2. FFT all symbols at once
+        # Real input: the half spectrum (rfft) holds every active bin (all below Nyquist)
+        responses = fft.rfft(symbols, n=self.n_fft, axis=1, workers=-1)[:, self.active_bins]
 
-            # Bit Decision: Real > 0 -> 1, Real < 0 -> 0
-            # (Recall mapping: 1->1, 0->-1)
-            bits = (np.real(diff) > 0).astype(int)
-            all_bits.append(bits)
+        # DBPSK Demodulation (each symbol against the previous one)
+        # diff = curr * conj(prev)
+        # If phase didn't change (1): curr ~= prev => curr * conj(prev) ~= |prev|^2 (Real Positive)
+        # If phase flipped (-1): curr ~= -prev => curr * conj(prev) ~= -|prev|^2 (Real Negative)
+        # Only Re(diff) is needed: Re(curr * conj(prev)) = curr.re * prev.re + curr.im * prev.im
+        re, im = responses.real, responses.imag
+        diff_real = re[1:] * re[:-1] + im[1:] * im[:-1]
 
-            # Update reference
-            prev_response = curr_response
+        # Bit Decision: Real > 0 -> 1, Real < 0 -> 0 (branchless, bool reinterpreted as uint8)
+        # (Recall mapping: 1->1, 0->-1)
+        bits: np.ndarray = (diff_real > 0).view(np.uint8)
 
-        return np.concatenate(all_bits)
+        return bits.reshape(-1)
 
     def bits_from_bytes(self, payload: bytes) -> np.ndarray:
         """Helper to convert bytes to bit array"""
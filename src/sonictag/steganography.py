@@ -1,11 +1,10 @@
 import math
 import random
-import struct
 
 import numpy as np
 from scipy import signal
 
-from .transceiver import SonicReceiver, SonicTransmitter
+from .transceiver import _FRAGMENT_HEADER, SonicReceiver, SonicTransmitter
 
 
 class SonicScanner:
@@ -26,6 +25,24 @@ class SonicScanner:
         self.start_freq = start_freq
         self.end_freq = end_freq
 
+        # Ultrasonic pre-filter, designed once (band and rate are fixed per scanner)
+        self._bandpass_sos = signal.butter(
+            4,
+            [self.start_freq, self.end_freq],
+            btype="bandpass",
+            fs=self.fs,
+            output="sos",
+        )
+
+    def _window_rms(self, data: np.ndarray, step: int) -> np.ndarray:
+        """
+        RMS of every window_samples long window of data, taken every step samples.
+        All windows at once: row-wise dot products over a strided view (no copy).
+        """
+        windows = np.lib.stride_tricks.sliding_window_view(data, self.window_samples)[::step]
+        rms: np.ndarray = np.sqrt(np.einsum("ij,ij->i", windows, windows) / self.window_samples)
+        return rms
+
     def find_windows(
         self, host_audio: np.ndarray, top_n: int | None = None, threshold_rms: float = 0.05
     ) -> list[tuple]:
@@ -44,40 +61,31 @@ class SonicScanner:
         n_samples, n_channels = work_audio.shape
         step = self.window_samples // 2
 
-        all_candidates = []  # (RMS, channel, start, end)
+        all_candidates: list[tuple[float, int, int, int]] = []  # (RMS, channel, start, end)
 
         # Scan each channel
         for ch in range(n_channels):
             channel_data = work_audio[:, ch]
 
             # --- Pre-filter (Ultrasonic Detection) ---
-            sos = signal.butter(
-                4,
-                [self.start_freq, self.end_freq],
-                btype="bandpass",
-                fs=self.fs,
-                output="sos",
-            )
-            ultrasonic_layer = signal.sosfilt(sos, channel_data)
+            ultrasonic_layer = signal.sosfilt(self._bandpass_sos, channel_data)
 
             if len(channel_data) < self.window_samples:
                 continue
 
-            # Scan Loop
-            for i in range(0, len(channel_data) - self.window_samples + 1, step):
-                window = channel_data[i : i + self.window_samples]
-                us_window = ultrasonic_layer[i : i + self.window_samples]
-
-                # Broadband Loudness
-                rms_broadband = np.sqrt(np.mean(window**2))
+            # Scan all windows at once (half-window hop)
+            starts = np.arange(0, len(channel_data) - self.window_samples + 1, step)
+            rms_interference = self._window_rms(ultrasonic_layer, step)
+            rms_broadband = self._window_rms(channel_data, step)
 
-                # Ultrasonic Interference
-                rms_interference = np.sqrt(np.mean(us_window**2))
+            # Ultrasonic Interference: reject windows already carrying ultrasonic energy
+            keep = rms_interference <= 0.05
 
-                if rms_interference > 0.05:
-                    continue
-
-                all_candidates.append((rms_broadband, ch, i, i + self.window_samples))
+            # Broadband Loudness
+            all_candidates.extend(
+                (rms, ch, start, start + self.window_samples)
+                for rms, start in zip(rms_broadband[keep].tolist(), starts[keep].tolist(), strict=True)
+            )
 
         # Sort Globally by RMS
         all_candidates.sort(key=lambda x: x[0], reverse=True)
@@ -124,6 +132,11 @@ class SonicStegoEncoder:
         self.scanner = SonicScanner(sample_rate=sample_rate)
         self.tx = SonicTransmitter(sample_rate=sample_rate)
 
+        # Fragment fade in/out ramps (5ms), computed once
+        fade_len = int(0.005 * self.fs)
+        self._fade_in = np.linspace(0, 1, fade_len, dtype=np.float32)
+        self._fade_out = self._fade_in[::-1]
+
     def encode(self, host_audio: np.ndarray, payload: str, force_splits: int | None = None) -> np.ndarray:
         """
         Encodes a string payload into the host audio.
@@ -132,15 +145,15 @@ class SonicStegoEncoder:
         payload_bytes = payload.encode("utf-8")
 
         # Unified Mono/Multi handling
-        was_mono = False
-        if host_audio.ndim == 1:
-            was_mono = True
-            work_audio = host_audio[:, np.newaxis].astype(np.float32).copy()
-        else:
-            work_audio = host_audio.astype(np.float32).copy()
+        was_mono = host_audio.ndim == 1
+        source_audio = host_audio[:, np.newaxis] if was_mono else host_audio
 
+        # Both branches return a fresh float32 copy (even for float32 input): no extra copy needed
         if host_audio.dtype == np.int16:
-            work_audio = work_audio / 32767.0
+            # Cast and scale in a single pass (no intermediate float32 copy of the int samples)
+            work_audio = np.divide(source_audio, np.float32(32767.0), dtype=np.float32)
+        else:
+            work_audio = source_audio.astype(np.float32)
 
         # 1. Determine Splits / Find Windows
         if force_splits:
@@ -195,7 +208,7 @@ class SonicStegoEncoder:
             chunk = payload[start:end]
 
             # Header: [MsgID, Index, Total]
-            header = struct.pack("BBB", msg_id, i, n_fragments)
+            header = _FRAGMENT_HEADER.pack(msg_id, i, n_fragments)
             full_payload = header + chunk
 
             fragments_bytes.append(full_payload)
@@ -215,15 +228,17 @@ class SonicStegoEncoder:
         n_samples, n_channels = host_audio.shape
 
         # Headroom
-        if apply_headroom:
-            current_max = np.max(np.abs(host_audio))
-            if current_max > 0:
-                target_host_peak = 0.8
-                scaling_factor = target_host_peak / max(current_max, 1e-9)
-                host_audio *= scaling_factor
-
-        fade_len = int(0.005 * self.fs)
-        fragment_amp = 0.2
+        # Rather than scaling the whole host up front and again when normalizing,
+        # fragments are added at fragment_amp / scaling_factor and the host is rescaled once at the end:
+        # (s * host + frag) * k == (host + frag / s) * (s * k)
+        current_max = np.max(np.abs(host_audio))
+        scaling_factor = 1.0
+        if apply_headroom and current_max > 0:
+            target_host_peak = 0.8
+            scaling_factor = target_host_peak / max(current_max, 1e-9)
+
+        fade_len = len(self._fade_in)
+        fragment_amp = 0.2 / scaling_factor
 
         for fragment, window_tuple in zip(fragments, windows, strict=True):
             ch, start, end = window_tuple
@@ -239,16 +254,18 @@ class SonicStegoEncoder:
 
             # Fade
             if frag_len > 2 * fade_len:
-                scaled_frag[:fade_len] *= np.linspace(0, 1, fade_len)
-                scaled_frag[-fade_len:] *= np.linspace(1, 0, fade_len)
+                scaled_frag[:fade_len] *= self._fade_in
+                scaled_frag[-fade_len:] *= self._fade_out
 
             host_audio[start : start + frag_len, ch] += scaled_frag
 
-        # Normalize to initial max
+        # Normalize to initial max (the headroom factor cancels out), or apply the headroom only
         if normalize_output:
             final_peak = np.max(np.abs(host_audio))
             if final_peak > 0:
                 host_audio *= current_max / final_peak
+        elif scaling_factor != 1.0:
+            host_audio *= scaling_factor
 
         return host_audio
 
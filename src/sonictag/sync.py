@@ -1,8 +1,60 @@
+from functools import lru_cache
+
 import numpy as np
-from scipy import signal
+from scipy import fft, signal
 
 from .logger import logger
 
+# Below this many multiply-adds (valid lags x preamble length), direct correlation
+# is cheaper than the FFT round trip: measured crossover ~2.5e5 for the 480-sample chirp
+# with a multi-threaded FFT (a single core keeps direct ahead past 1e6), so 1 << 18 ~ 2.6e5
+_DIRECT_CORR_MAX_OPS = 1 << 18
+
+# Overlap-save FFT tile size for longer searches (64KB of float64 per tile: fits in L2)
+_CORR_BLOCK_SIZE = 8192
+
+
+@lru_cache(maxsize=8)
+def _build_preamble(sample_rate: int, start_freq: int, end_freq: int, duration: float) -> np.ndarray:
+    """
+    Generates the windowed linear chirp preamble.
+    Cached: Transmitter, Receiver and Stego objects all build the same preamble,
+    so the array is returned read-only and shared between them.
+    """
+    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    preamble = signal.chirp(t, f0=start_freq, f1=end_freq, t1=duration, method="linear")
+
+    # Normalize preamble
+    preamble /= np.max(np.abs(preamble))
+
+    # Apply Window to prevent clicks at start/end of preamble
+    # Tukey window with alpha=0.1 (10% taper)
+    window = signal.windows.tukey(len(preamble), alpha=0.1)
+    preamble *= window
+
+    # Designed in float64, stored in float32 like the rest of the audio pipeline
+    preamble = preamble.astype(np.float32)
+    preamble.flags.writeable = False
+    return preamble
+
+
+@lru_cache(maxsize=32)
+def _build_preamble_spectrum(
+    sample_rate: int, start_freq: int, end_freq: int, duration: float, block: int, single: bool
+) -> np.ndarray:
+    """
+    Conjugated rfft of the preamble zero-padded to block samples (complex64 if single).
+    Cached like the preamble itself: every SonicSync (one per Receiver, i.e. per
+    Stego decoder / web task) reuses the same read-only spectra.
+    """
+    preamble = _build_preamble(sample_rate, start_freq, end_freq, duration)
+    if not single:
+        preamble = preamble.astype(np.float64)
+
+    ref_fft = np.conj(fft.rfft(preamble, n=block))
+    ref_fft.flags.writeable = False
+    return ref_fft
+
 
 class SonicSync:
     """
@@ -22,17 +74,8 @@ class SonicSync:
         self.end_freq = end_freq
         self.duration = duration
 
-        # Generate the reference chirp
-        t = np.linspace(0, self.duration, int(self.fs * self.duration), endpoint=False)
-        self.preamble = signal.chirp(t, f0=self.start_freq, f1=self.end_freq, t1=self.duration, method="linear")
-
-        # Normalize preamble
-        self.preamble /= np.max(np.abs(self.preamble))
-
-        # Apply Window to prevent clicks at start/end of preamble
-        # Tukey window with alpha=0.1 (10% taper)
-        window = signal.windows.tukey(len(self.preamble), alpha=0.1)
-        self.preamble *= window
+        # Generate the reference chirp (shared by every instance with the same parameters)
+        self.preamble = _build_preamble(self.fs, self.start_freq, self.end_freq, self.duration)
 
         # Pre-compute time-reversed preamble for convolution (correlation)
         # Correlation is Convolution with time-reversed signal.
@@ -42,12 +85,50 @@ class SonicSync:
         # This is strictly sum(sample^2) if using direct correlation
         self.max_peak = np.sum(self.preamble**2)
 
+        # Largest overlap-save tile for _correlate (power of two, at least 4x the preamble)
+        self._block_size = max(_CORR_BLOCK_SIZE, 1 << (4 * len(self.preamble) - 1).bit_length())
+
     def generate_preamble(self) -> np.ndarray:
         """
         Returns the generated preamble.
         """
         return self.preamble
 
+    def _correlate(self, audio_chunk: np.ndarray) -> np.ndarray:
+        """
+        Cross-correlates audio_chunk with the preamble ('valid' mode).
+        Short searches use a direct dot product; longer ones use overlap-save on fixed-size
+        tiles, so the preamble spectrum is computed once and every tile stays cache-resident.
+        """
+        preamble_len = len(self.preamble)
+        n_valid = len(audio_chunk) - preamble_len + 1
+
+        # Short searches (chunk barely longer than the preamble): direct sliding dot product
+        if n_valid * preamble_len <= _DIRECT_CORR_MAX_OPS:
+            return np.correlate(audio_chunk, self.preamble, mode="valid")
+
+        # Overlap-save: each tile of block samples yields `step` valid lags.
+        # Circular correlation is enough: those lags never wrap around inside a tile.
+        # Short chunks use a single power-of-two tile: the cache holds only a few sizes
+        block = min(self._block_size, 1 << (len(audio_chunk) - 1).bit_length())
+        step = block - preamble_len + 1
+        n_blocks = -(-n_valid // step)
+
+        # Zero-pad the tail so the last tile is complete
+        padded = np.zeros((n_blocks - 1) * step + block, dtype=audio_chunk.dtype)
+        padded[: len(audio_chunk)] = audio_chunk
+        tiles = np.lib.stride_tricks.sliding_window_view(padded, block)[::step]
+
+        # float32 input stays in single precision (complex64 spectra): half the memory traffic
+        single = audio_chunk.dtype == np.float32
+
+        ref_fft = _build_preamble_spectrum(self.fs, self.start_freq, self.end_freq, self.duration, block, single)
+
+        tiles_fft = fft.rfft(tiles, axis=-1, workers=-1)
+        corr = fft.irfft(tiles_fft * ref_fft, n=block, axis=-1, workers=-1)
+
+        return corr[:, :step].reshape(-1)[:n_valid]
+
     def detect(self, audio_chunk: np.ndarray, min_peak: float = 4.0, min_snr: float = 3.0) -> int:
         """
         Finds the sample index where the preamble STARTS.
@@ -62,7 +143,7 @@ class SonicSync:
         # mode='valid' means the output consists only of those elements that do not rely on zero-padding.
         # Length of result = len(audio_chunk) - len(preamble) + 1
         # Index i corresponds to alignment of preamble starting at audio_chunk[i]
-        corr = signal.correlate(audio_chunk, self.preamble, mode="valid")
+        corr = self._correlate(audio_chunk)
         corr_mag = np.abs(corr)
 
         # Find max peak
@@ -8,6 +8,12 @@ from .logger import logger
 from .ofdm import SonicOFDM
 from .sync import SonicSync
 
+# Sample offsets explored around the expected payload start, in order
+_SYNC_JITTER_OFFSETS = (0, -1, 1, -2, 2, -3, 3, -4, 4)
+
+# Fragment header: [MsgID (1B)] [Index (1B)] [Total (1B)], compiled once
+_FRAGMENT_HEADER = struct.Struct("BBB")
+
 
 class SonicTransmitter:
     """
@@ -20,6 +26,25 @@ class SonicTransmitter:
         self.ofdm = SonicOFDM(sample_rate=self.fs)
         self.sync = SonicSync(sample_rate=self.fs)
 
+        # Fade in/out ramps applied to every frame (5ms taper), computed once
+        taper_len = int(0.005 * self.fs)
+        self._fade_in = np.linspace(0, 1, taper_len, dtype=np.float32)
+        self._fade_out = self._fade_in[::-1]
+
+        # Everything before the OFDM data is identical for every frame: build it once
+        # WARM UP SYMBOL bits (see create_audio_frame)
+        # uint8 like bits_from_bytes: the bit vector stays 1 byte per bit until the BPSK mapping
+        self._warmup_bits = np.ones(self.ofdm.bits_per_symbol, dtype=np.uint8)
+        # [Preamble] [Silence gap (Guard Interval, 20ms)]
+        gap_len = int(0.02 * self.fs)
+        self._frame_head = np.concatenate([self.sync.generate_preamble(), np.zeros(gap_len, dtype=np.float32)])
+
+        # Smoothing bandpass (17kHz - 21kHz), designed once
+        # float32 coefficients keep the filtered frame in float32
+        self._bandpass_sos = signal.butter(4, [17000, 21000], btype="bandpass", fs=self.fs, output="sos").astype(
+            np.float32
+        )
+
     def create_audio_frame(self, payload: bytes) -> np.ndarray:
         """
         Creates a full audio frame:
@@ -34,28 +59,23 @@ class SonicTransmitter:
         # WARM UP SYMBOL: Prepend a full symbol of 1s.
         # This causes the Modulator to repeat the Reference Symbol Phase (since 1 -> No Change).
         # This stabilizes the filter/channel before the real header bits.
-        warmup_bits = np.ones(self.ofdm.bits_per_symbol, dtype=int)
-        bits = np.concatenate([warmup_bits, bits])
+        bits = np.concatenate([self._warmup_bits, bits])
 
         # 3. Modulate (OFDM)
         ofdm_signal = self.ofdm.modulate(bits)
 
-        # 4. Generate Preamble
-        preamble = self.sync.generate_preamble()
-
-        # 5. Concatenate
-        # Add a silence gap (Guard Interval) to prevent Preamble filter ringing/reverb
+        # 4. Concatenate with the prebuilt [Preamble] [Gap] head
+        # The silence gap (Guard Interval) prevents Preamble filter ringing/reverb
         # from interfering with the Reference Symbol.
-        gap_len = int(0.02 * self.fs)  # 20ms gap
-        gap = np.zeros(gap_len, dtype=np.float32)
-
-        raw_signal = np.concatenate([preamble, gap, ofdm_signal])
+        head_len = len(self._frame_head)
+        raw_signal = np.empty(head_len + len(ofdm_signal), dtype=np.float32)
+        raw_signal[:head_len] = self._frame_head
+        raw_signal[head_len:] = ofdm_signal
 
-        # 6. Apply Bandpass Filter to smooth discontinuities
+        # 5. Apply Bandpass Filter to smooth discontinuities
         # The raw concatenation of OFDM symbols creates step discontinuities.
         # These appear as broadband noise (clicks) at the symbol rate (~88Hz).
-        sos = signal.butter(4, [17000, 21000], btype="bandpass", fs=self.fs, output="sos")
-        full_signal = signal.sosfiltfilt(sos, raw_signal)
+        full_signal = signal.sosfiltfilt(self._bandpass_sos, raw_signal)
         # full_signal = raw_signal # BYPASS
 
         # Final normalize
@@ -65,12 +85,12 @@ class SonicTransmitter:
 
         # Apply a tiny fade in/out to the ENTIRE frame to ensure it starts/ends at 0
         # This prevents the "click" when the audio hardware starts playing a non-zero sample.
-        taper_len = int(0.005 * self.fs)  # 5ms taper
+        taper_len = len(self._fade_in)  # 5ms taper
         # Length is always sufficient due to preamble
         # Fade In
-        full_signal[:taper_len] *= np.linspace(0, 1, taper_len)
+        full_signal[:taper_len] *= self._fade_in
         # Fade Out
-        full_signal[-taper_len:] *= np.linspace(1, 0, taper_len)
+        full_signal[-taper_len:] *= self._fade_out
 
         return full_signal
 
@@ -86,13 +106,17 @@ class SonicReceiver:
         self.ofdm = SonicOFDM(sample_rate=self.fs)
         self.sync = SonicSync(sample_rate=self.fs)
 
-        # Design Filter
-        # Highpass Butterworth at 3kHz
-        # Lower order (2) to minimize phase distortion
-        nyquist = 0.5 * self.fs
-        normal_cutoff = 17000 / nyquist
-        # Ensure cutoff < 1.0 (3k < 24k)
-        self.b, self.a = signal.butter(2, normal_cutoff, btype="high", analog=False)
+        # Cleaning filters used by filter_signal, designed once
+        # Highpass order 2 to minimize phase distortion
+        # float32 coefficients: float32 input (microphone, WAV) is filtered in single precision
+        highpass_sos = signal.butter(2, 16000, "hp", fs=self.fs, output="sos")
+        bandpass_sos = signal.butter(4, [17000, 21000], "bp", fs=self.fs, output="sos")
+        # Cascading two SOS filters is just stacking their sections: one sosfilt pass does both
+        self._clean_sos = np.vstack([highpass_sos, bandpass_sos]).astype(np.float32)
+
+        # Frame layout is fixed: payload starts Preamble + Gap samples after the sync index
+        gap_len = int(0.02 * self.fs)  # Must match Transmitter gap
+        self._payload_offset = len(self.sync.generate_preamble()) + gap_len
 
     def filter_signal(self, audio_chunk: np.ndarray) -> np.ndarray:
         """
@@ -101,18 +125,13 @@ class SonicReceiver:
         if len(audio_chunk) == 0:
             return audio_chunk
 
+        # Single pass over the cascade (see __init__):
         # 1. High-pass to remove DC/Hum (Critical for FFT)
         # 500Hz cutoff is safe for 1kHz+ carriers -> 16kHz for Ultrasonic
-        sos = signal.butter(2, 16000, "hp", fs=self.fs, output="sos")
-        filtered = signal.sosfilt(sos, audio_chunk)
-
         # 2. Band-pass (Keep only 2k - 10k)
         # Restoring with wider band to filter out low-freq noise/hum and high-freq aliasing
         # Ultrasonic 17k-21k
-        sos_bp = signal.butter(4, [17000, 21000], "bp", fs=self.fs, output="sos")
-        filtered = signal.sosfilt(sos_bp, filtered)
-
-        return filtered
+        return signal.sosfilt(self._clean_sos, audio_chunk)
 
     def decode_frame(self, audio_chunk: np.ndarray) -> tuple[bytes | None, int]:
         """
@@ -127,36 +146,34 @@ class SonicReceiver:
         # Some mics/browsers invert the phase, which might break reference tracking in DBPSK
         # (though DBPSK is theoretically robust, reference initialization matters).
 
-        candidates = [(audio_chunk, "Normal"), (-audio_chunk, "Inverted")]
+        # Filtering and correlation are linear, so the inverted candidate is just -filtered_chunk
+        # and shares the same |correlation|: filter and search for the preamble only once.
 
-        for signal_candidate, polarity in candidates:
-            # 1. Filter
-            filtered_chunk = self.filter_signal(signal_candidate)
+        # 1. Filter
+        filtered_chunk = self.filter_signal(audio_chunk)
 
-            # 2. Sync Detect
-            # Increase threshold to avoid false positives on noise
-            start_idx = self.sync.detect(filtered_chunk, min_peak=5.0)
+        # 2. Sync Detect
+        # Increase threshold to avoid false positives on noise
+        start_idx = self.sync.detect(filtered_chunk, min_peak=5.0)
 
-            if start_idx == -1:
-                continue  # Try next polarity or fail
+        if start_idx == -1:
+            return None, 0
 
-            # Found Preamble
-            preamble_len = len(self.sync.generate_preamble())
-            gap_len = int(0.02 * self.fs)  # Must match Transmitter gap
-
-            # Sync Jitter loop
-            offsets = [0, -1, 1, -2, 2, -3, 3, -4, 4]
+        for polarity in ("Normal", "Inverted"):
+            signal_candidate = filtered_chunk if polarity == "Normal" else -filtered_chunk
 
+            # Found Preamble: payload starts after Preamble + Gap (see __init__)
             logger.debug(f"Sync Locked ({polarity}) at {start_idx}. Exploring offsets...")
 
-            for offset in offsets:
+            # Sync Jitter loop
+            for offset in _SYNC_JITTER_OFFSETS:
                 try:
-                    packet_start = start_idx + preamble_len + gap_len + offset
+                    packet_start = start_idx + self._payload_offset + offset
 
-                    if packet_start >= len(filtered_chunk):
+                    if packet_start >= len(signal_candidate):
                         continue
 
-                    raw_signal = filtered_chunk[packet_start:]
+                    raw_signal = signal_candidate[packet_start:]
 
                     # Demodulate
                     all_bits = self.ofdm.demodulate(raw_signal)
@@ -187,16 +204,16 @@ class SonicReceiver:
         Expects payload format: [MsgID (1B)] [Index (1B)] [Total (1B)] [Data...]
         Returns full payload if complete, else None.
         """
-        if len(payload) < 3:
+        if len(payload) < _FRAGMENT_HEADER.size:
             return payload  # Too short to be a fragment, return as is
 
-        msg_id, index, total = struct.unpack("BBB", payload[:3])
+        msg_id, index, total = _FRAGMENT_HEADER.unpack_from(payload)
 
         # Basic logical checks (Total must be > 1 to be a split, or at least >= 1. 255 max)
         if total == 0 or index >= total:
             return payload
 
-        data = payload[3:]
+        data = payload[_FRAGMENT_HEADER.size :]
 
         # Initialize buffer
 
@@ -223,10 +240,9 @@ class SonicReceiver:
         # We need check if we have ALL indices from 0 to total-1
         # Simple len check is insufficient if malicious/erroneous indices exist (e.g. 0,1,5 for total 3)
         if len(buffer["fragments"]) == total:
-            # Reconstruct
-            full_data = b""
-            for i in range(total):
-                full_data += buffer["fragments"][i]
+            # Reconstruct (single join instead of repeated bytes concatenation)
+            fragments = buffer["fragments"]
+            full_data = b"".join(fragments[i] for i in range(total))
 
             # Clean buffer
             del self._fragment_buffer[msg_id]
@@ -89,6 +89,22 @@ DATABASES = {
 # Celery Configuration
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://redis:6379/0")
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", "redis://redis:6379/0")
+# Stego processing is long and CPU-bound: dedicated queue, one task reserved per worker process
+# (no long task stuck behind another in a prefetch buffer)
+CELERY_TASK_ROUTES = {"stego_core.tasks.process_stego_task": {"queue": "stego_cpu"}}
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# acks_late tasks left unacked this many seconds (worker lost mid-task) are redelivered by Redis
+CELERY_BROKER_TRANSPORT_OPTIONS = {"visibility_timeout": int(os.environ.get("CELERY_VISIBILITY_TIMEOUT", 60 * 60))}
+# Seconds a stego task may run before it fails (soft time limit)
+STEGO_TASK_TIME_LIMIT = int(os.environ.get("STEGO_TASK_TIME_LIMIT", 30 * 60))
+# Seconds after which a PROCESSING claim is considered abandoned and a redelivered message may
+# take the task over: never before the broker would redeliver, nor while a live task may still run
+STEGO_CLAIM_TIMEOUT = max(CELERY_BROKER_TRANSPORT_OPTIONS["visibility_timeout"], STEGO_TASK_TIME_LIMIT + 60)
+# Seconds an ffprobe/ffmpeg decode of an upload may take before the task fails
+STEGO_FFMPEG_TIMEOUT = int(os.environ.get("STEGO_FFMPEG_TIMEOUT", 120))
+
+# Task status notifications (pub/sub behind the Server-Sent Events endpoint)
+REDIS_URL = os.environ.get("REDIS_URL", CELERY_BROKER_URL)
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -0,0 +1,70 @@
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = {"COMPLETED", "ERROR"}
+
+# Comment line sent while waiting, so proxies do not close an idle stream
+HEARTBEAT_SECONDS = 15
+# A stream never outlives this, even if the task is stuck (the client reconnects)
+# Each open stream occupies a web server thread (gthread workers, see docker-compose.yml)
+MAX_STREAM_SECONDS = 600
+
+
+def _channel(task_id) -> str:
+    return f"task:{task_id}"
+
+
+@lru_cache(maxsize=1)
+def _get_redis() -> redis.Redis:
+    # Created lazily: each process (web or forked Celery worker) gets its own connection pool
+    return redis.Redis.from_url(settings.REDIS_URL)
+
+
+def publish_status(task_id, status: str):
+    """
+    Notifies the clients streaming this task that its status changed.
+    Best effort: a Redis outage must not fail the task itself.
+    """
+    try:
+        _get_redis().publish(_channel(task_id), status)
+    except redis.RedisError as e:
+        logger.warning(f"Could not publish status {status} for task {task_id}: {e}")
+
+
+def _format_event(data: dict) -> str:
+    return f"data: {json.dumps(data, cls=JSONEncoder)}\n\n"
+
+
+def status_events(task_id, snapshot: Callable[[], dict]) -> Iterator[str]:
+    """
+    Server-Sent Events stream for one task.
+    Sends the current state, then a fresh snapshot after every published status change,
+    and ends once the task reaches a terminal status.
+    """
+    pubsub = _get_redis().pubsub(ignore_subscribe_messages=True)
+    # Subscribe before the first snapshot: a change in between is not missed
+    pubsub.subscribe(_channel(task_id))
+    try:
+        data = snapshot()
+        yield _format_event(data)
+
+        deadline = time.monotonic() + MAX_STREAM_SECONDS
+        while data["task_status"] not in TERMINAL_STATUSES and time.monotonic() < deadline:
+            message = pubsub.get_message(timeout=HEARTBEAT_SECONDS)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            data = snapshot()
+            yield _format_event(data)
+    finally:
+        pubsub.close()
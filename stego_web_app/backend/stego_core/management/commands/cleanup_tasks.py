@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.utils import timezone
+
+from stego_core.models import AudioTask
+from stego_core.signals import cleanup_audio_files
+
+
+class Command(BaseCommand):
+    help = "Bulk delete old AudioTasks and their audio files."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7, help="Delete tasks created more than N days ago")
+        parser.add_argument("--status", choices=[s for s, _ in AudioTask.STATUS_CHOICES], help="Only this status")
+        parser.add_argument("--workers", type=int, default=8, help="Threads used to unlink files")
+
+    def handle(self, *args, **options):
+        tasks = AudioTask.objects.filter(created_at__lt=timezone.now() - timedelta(days=options["days"]))
+        if options["status"]:
+            tasks = tasks.filter(task_status=options["status"])
+
+        with transaction.atomic():
+            # Collect every file in one query, then delete the rows in one DELETE:
+            # without the per-row post_delete receiver, Django does not fetch and signal each instance
+            # (files are removed below in one batch instead of one Celery task per row)
+            rows = list(tasks.values_list("original_file", "processed_file"))
+            file_names = [name for pair in rows for name in pair if name]
+
+            post_delete.disconnect(cleanup_audio_files, sender=AudioTask)
+            try:
+                deleted, _ = tasks.delete()
+            finally:
+                post_delete.connect(cleanup_audio_files, sender=AudioTask)
+
+        # Rows are committed as deleted: unlink the files concurrently (I/O bound)
+        with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+            list(pool.map(default_storage.delete, file_names))
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} task(s) and {len(file_names)} file(s)."))
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stego_core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="audiotask",
+            index=models.Index(fields=["-created_at"], name="audiotask_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="audiotask",
+            index=models.Index(fields=["task_status", "-created_at"], name="audiotask_status_created_idx"),
+        ),
+    ]
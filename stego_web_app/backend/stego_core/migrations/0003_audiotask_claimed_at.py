@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stego_core", "0002_audiotask_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="audiotask",
+            name="claimed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
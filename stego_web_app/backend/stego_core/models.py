@@ -25,9 +25,17 @@ class AudioTask(models.Model):
     error_message = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
+    # When a worker moved the task to PROCESSING (lets a redelivery reclaim a stale claim)
+    claimed_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Default ordering (list endpoint) is served by an index scan instead of a sort
+            models.Index(fields=["-created_at"], name="audiotask_created_idx"),
+            # Status-filtered listings (e.g. pending/errored tasks), newest first
+            models.Index(fields=["task_status", "-created_at"], name="audiotask_status_created_idx"),
+        ]
 
     def __str__(self):
         return f"Task {self.id} - {self.task_status}"
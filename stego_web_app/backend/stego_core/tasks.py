@@ -1,83 +1,231 @@
-import io
+import json
+import shutil
+import subprocess
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 import numpy as np
 import soundfile as sf
 from celery import shared_task
-from django.core.files.base import ContentFile
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db.models import Q
 from django.utils import timezone
-from pydub import AudioSegment
 
 # Import from the local library
 from sonictag.steganography import SonicStegoDecoder, SonicStegoEncoder
 
+from .events import publish_status
 from .models import AudioTask
 
+# Formats libsndfile decodes natively (no ffmpeg subprocess)
+SOUNDFILE_EXTENSIONS = {".wav", ".flac", ".ogg", ".aiff", ".aif"}
 
-@shared_task(bind=True)
+# Resolved once at import so the subprocess calls run an absolute path, not a PATH lookup per task
+FFPROBE = shutil.which("ffprobe") or "ffprobe"
+FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+
+
+@lru_cache(maxsize=8)
+def _get_encoder(samplerate: int) -> SonicStegoEncoder:
+    """
+    Encoder shared by every task of this worker process with the same sample rate.
+    Building one designs its filters, preamble and fade ramps; encode() keeps no state.
+    (Decoders are not shared: their receiver keeps fragment reassembly state.)
+    """
+    return SonicStegoEncoder(sample_rate=samplerate)
+
+
+def _run_tool(argv: list[str], path: Path) -> bytes:
+    """
+    Runs ffprobe/ffmpeg on path and returns its stdout.
+    Failures and timeouts raise ValueError with the tool's own message: it ends up in the
+    task's error_message, which must not expose the command line or server paths.
+    """
+    try:
+        # Fixed argv (no shell); the only variable arguments are our own storage path and channel count
+        result = subprocess.run(  # noqa: S603
+            argv, capture_output=True, check=True, timeout=settings.STEGO_FFMPEG_TIMEOUT
+        )
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode(errors="replace").strip().replace(str(path), path.name)
+        raise ValueError(message or "unsupported audio file") from None
+    except subprocess.TimeoutExpired:
+        raise ValueError("unsupported audio file (decoding timed out)") from None
+    return result.stdout
+
+
+def _probe_audio(path: Path) -> tuple[int, int]:
+    """
+    Returns (samplerate, channels) of the first audio stream, read by ffprobe.
+    """
+    result = _run_tool(
+        [
+            FFPROBE,
+            "-v",
+            "error",
+            "-select_streams",
+            "a:0",
+            "-show_entries",
+            "stream=sample_rate,channels",
+            "-of",
+            "json",
+            str(path),
+        ],
+        path,
+    )
+    streams = json.loads(result)["streams"]
+    if not streams:
+        raise ValueError(f"No audio stream found in {path.name}")
+
+    return int(streams[0]["sample_rate"]), int(streams[0]["channels"])
+
+
+def _load_audio(path: Path) -> tuple[np.ndarray, int]:
+    """
+    Reads an audio file as float32 samples in [-1, 1].
+    Returns (audio_data, samplerate), audio_data being (N,) for mono or (N, Channels).
+    """
+    if path.suffix.lower() in SOUNDFILE_EXTENSIONS:
+        # Decoded, scaled and deinterleaved by libsndfile in one pass
+        audio_data, samplerate = sf.read(path, dtype="float32")
+        return audio_data, samplerate
+
+    # Other formats (mp3, m4a, ...): ffmpeg decodes straight to float32 PCM on a pipe
+    # (no intermediate WAV file, no integer conversion pass)
+    samplerate, channels = _probe_audio(path)
+    # -map 0:a:0: decode the very stream ffprobe described (not ffmpeg's own default pick)
+    result = _run_tool(
+        [
+            FFMPEG,
+            "-v",
+            "error",
+            "-i",
+            str(path),
+            "-map",
+            "0:a:0",
+            "-f",
+            "f32le",
+            "-acodec",
+            "pcm_f32le",
+            "-ac",
+            str(channels),
+            "-",
+        ],
+        path,
+    )
+    audio_data = np.frombuffer(result, dtype=np.float32)
+
+    if channels > 1:
+        audio_data = audio_data.reshape((-1, channels))
+
+    return audio_data, samplerate
+
+
+def _to_pcm16(audio_data: np.ndarray) -> np.ndarray:
+    """
+    Quantizes float samples in [-1, 1] to int16 with explicit clipping.
+    Same 2^15 full scale as _load_audio, so a re-uploaded output reads back exactly.
+    Scaling, clipping and rounding run in place on a single float32 buffer.
+    """
+    pcm = np.multiply(audio_data, 32768.0, dtype=np.float32)
+    np.clip(pcm, -32768.0, 32767.0, out=pcm)
+    np.rint(pcm, out=pcm)
+    return pcm.astype(np.int16)
+
+
+# acks_late: a task lost with its worker is redelivered instead of dropped
+# soft_time_limit: a live task always ends (SoftTimeLimitExceeded -> ERROR) before its claim goes stale
+@shared_task(bind=True, acks_late=True, soft_time_limit=settings.STEGO_TASK_TIME_LIMIT)
 def process_stego_task(self, task_id):
+    # 1. Claim Task: atomic PENDING -> PROCESSING in a single conditional UPDATE
+    # A PROCESSING claim older than STEGO_CLAIM_TIMEOUT was left by a worker that died mid-task:
+    # the redelivered message (acks_late) takes it over instead of leaving the row stuck
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.STEGO_CLAIM_TIMEOUT)
+    claimed = (
+        AudioTask.objects.filter(id=task_id)
+        .filter(
+            Q(task_status="PENDING")
+            | Q(task_status="PROCESSING", claimed_at__lt=stale_before)
+            | Q(task_status="PROCESSING", claimed_at__isnull=True)
+        )
+        .update(task_status="PROCESSING", claimed_at=now)
+    )
+    if not claimed:
+        claim = AudioTask.objects.filter(id=task_id, task_status="PROCESSING").values_list("claimed_at", flat=True)
+        claimed_at = claim.first()
+        if claimed_at is not None:
+            # Live claim: its worker is still running (and will finish within the time limit), or it died
+            # and the broker redelivered before the claim expired. Check again once it has expired.
+            countdown = (claimed_at - stale_before).total_seconds() + 1
+            raise self.retry(countdown=countdown, max_retries=None)
+        return f"Task {task_id} already claimed, skipping."
+    publish_status(task_id, "PROCESSING")
+
     try:
-        # 1. Fetch Task
-        task = AudioTask.objects.get(id=task_id)
-        task.task_status = "PROCESSING"
-        task.save()
+        # Fetch only the columns the processing needs
+        task = AudioTask.objects.only("id", "original_file", "processed_file", "task_type", "hidden_message").get(
+            id=task_id
+        )
 
         original_file_path = Path(task.original_file.path)
 
-        # 2. Read Audio using Pydub
-        audio = AudioSegment.from_file(original_file_path)
-        samplerate = audio.frame_rate
+        # Result columns written together with the final status (single UPDATE)
+        result_fields = []
 
-        # Convert to numpy array and normalize to float32 [-1, 1]
-        samples = np.array(audio.get_array_of_samples())
-
-        if audio.sample_width == 2:
-            audio_data = samples.astype(np.float32) / 32768.0
-        elif audio.sample_width == 4:
-            audio_data = samples.astype(np.float32) / 2147483648.0
-        elif audio.sample_width == 1:
-            audio_data = (samples.astype(np.float32) - 128.0) / 128.0
-        else:
-            max_val = float(2 ** (8 * audio.sample_width - 1))
-            audio_data = samples.astype(np.float32) / max_val
-
-        if audio.channels > 1:
-            audio_data = audio_data.reshape((-1, audio.channels))
+        # 2. Read Audio (float32 in [-1, 1], shape (N,) or (N, Channels))
+        audio_data, samplerate = _load_audio(original_file_path)
 
         if task.task_type == "ENCODE":
             # 3. Encode
-            encoder = SonicStegoEncoder(sample_rate=samplerate)
+            encoder = _get_encoder(samplerate)
             message = task.hidden_message
             stego_audio = encoder.encode(audio_data, message)
 
             # 4. Save Result (WAV)
-            buffer = io.BytesIO()
-            sf.write(buffer, stego_audio, samplerate, format="WAV")
-            buffer.seek(0)
-
+            # Streamed through a temporary file: storage copies it in chunks instead of
+            # holding the encoded WAV in memory (16-bit PCM: 2 bytes per sample)
             new_filename = f"{original_file_path.stem}_stego.wav"
-            task.processed_file.save(new_filename, ContentFile(buffer.read()), save=False)
+            with NamedTemporaryFile(suffix=".wav") as tmp:
+                sf.write(tmp, _to_pcm16(stego_audio), samplerate, format="WAV", subtype="PCM_16")
+                tmp.seek(0)
+                task.processed_file.save(new_filename, File(tmp), save=False)
+            result_fields.append("processed_file")
 
         elif task.task_type == "DECODE":
             # 3. Decode
             decoder = SonicStegoDecoder(sample_rate=samplerate)
             decoded_message = decoder.decode(audio_data)
 
-            # 4. Save Result (Message)
+            # 4. Save Result (Message, stored with the status below)
             task.hidden_message = decoded_message
-            task.save(update_fields=["hidden_message"])
+            result_fields.append("hidden_message")
 
         # 5. Update Status
         task.task_status = "COMPLETED"
         task.completed_at = timezone.now()
-        task.save()
+        task.save(update_fields=["task_status", "completed_at", *result_fields])
+        publish_status(task_id, "COMPLETED")
 
         return f"Task {task_id} ({task.task_type}) completed successfully."
 
     except Exception as e:
-        # Handle failures gracefully
-        if "task" in locals():
-            task.task_status = "ERROR"
-            task.error_message = str(e)
-            task.save()
+        # Handle failures gracefully (single UPDATE, no need for the fetched row)
+        AudioTask.objects.filter(id=task_id).update(task_status="ERROR", error_message=str(e))
+        publish_status(task_id, "ERROR")
         return f"Task failed: {str(e)}"
+
+
+@shared_task
+def delete_media_files(file_names: list[str]):
+    """
+    Removes stored audio files (storage-relative names) off the request path.
+    Missing files are ignored: the storage delete is a no-op for them.
+    """
+    for name in file_names:
+        default_storage.delete(name)
+    return f"Deleted {len(file_names)} file(s)."
@@ -0,0 +1,85 @@
+from datetime import timedelta
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from celery.exceptions import Retry
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from . import tasks
+from .models import AudioTask
+
+
+@mock.patch.object(tasks, "publish_status")
+class ProcessStegoTaskClaimTests(TestCase):
+    """
+    Claiming a task for processing (redelivered acks_late messages included).
+    """
+
+    def _create_task(self, **fields):
+        return AudioTask.objects.create(original_file="input_audio/host.wav", task_type="DECODE", **fields)
+
+    def test_fresh_processing_claim_is_not_reclaimed(self, _publish_status):
+        claimed_at = timezone.now()
+        task = self._create_task(task_status="PROCESSING", claimed_at=claimed_at)
+
+        with mock.patch.object(tasks, "_load_audio") as load_audio, self.assertRaises(Retry):
+            tasks.process_stego_task.run(str(task.id))
+
+        load_audio.assert_not_called()
+        task.refresh_from_db()
+        self.assertEqual(task.task_status, "PROCESSING")
+        self.assertEqual(task.claimed_at, claimed_at)
+
+    def test_stale_processing_claim_is_reclaimed(self, _publish_status):
+        stale = timezone.now() - timedelta(seconds=settings.STEGO_CLAIM_TIMEOUT + 1)
+        task = self._create_task(task_status="PROCESSING", claimed_at=stale)
+
+        with mock.patch.object(tasks, "_load_audio", side_effect=ValueError("bad audio")) as load_audio:
+            tasks.process_stego_task.run(str(task.id))
+
+        load_audio.assert_called_once()
+        task.refresh_from_db()
+        self.assertEqual(task.task_status, "ERROR")
+        self.assertGreater(task.claimed_at, stale)
+
+    def test_finished_task_is_skipped(self, _publish_status):
+        task = self._create_task(task_status="COMPLETED")
+
+        with mock.patch.object(tasks, "_load_audio") as load_audio:
+            result = tasks.process_stego_task.run(str(task.id))
+
+        load_audio.assert_not_called()
+        self.assertIn("already claimed", result)
+
+
+class DownloadTests(TestCase):
+    """
+    GET /api/tasks/{id}/download/
+    """
+
+    def setUp(self):
+        self.media_root = TemporaryDirectory()
+        self.addCleanup(self.media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_download_ignores_accept_header(self):
+        task = AudioTask.objects.create(original_file="input_audio/host.wav", task_status="COMPLETED")
+        task.processed_file.save("stego.wav", ContentFile(b"RIFF"))
+
+        response = self.client.get(f"/api/tasks/{task.id}/download/", HTTP_ACCEPT="audio/wav")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"RIFF")
+        self.assertIn("attachment", response["Content-Disposition"])
+
+    def test_download_without_processed_file(self):
+        task = AudioTask.objects.create(original_file="input_audio/host.wav")
+
+        response = self.client.get(f"/api/tasks/{task.id}/download/", HTTP_ACCEPT="audio/wav")
+
+        self.assertEqual(response.status_code, 404)
@@ -1,8 +1,44 @@
-from rest_framework import mixins, viewsets
+import json
+from pathlib import Path
+
+from django.db import connection, transaction
+from django.http import FileResponse, StreamingHttpResponse
+from rest_framework import mixins, negotiation, renderers, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.parsers import FormParser, MultiPartParser
 
+from .events import status_events
 from .models import AudioTask
 from .serializers import AudioTaskSerializer
+from .tasks import process_stego_task
+
+
+class EventStreamRenderer(renderers.BaseRenderer):
+    """
+    Lets EventSource clients (Accept: text/event-stream) through content negotiation.
+    The stream itself bypasses renderers; only error responses (e.g. 404) are rendered here.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return f"event: error\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class IgnoreClientContentNegotiation(negotiation.BaseContentNegotiation):
+    """
+    Always picks the first renderer, whatever the Accept header says.
+    For file downloads: the FileResponse bypasses renderers, so a client asking for e.g.
+    audio/wav must not get a 406; only error responses (e.g. 404) are rendered, as JSON.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return (renderers[0], renderers[0].media_type)
 
 
 class AudioTaskViewSet(
@@ -12,8 +48,46 @@ class AudioTaskViewSet(
     API Endpoint for uploading audio tasks and tracking their status.
     POST /: Upload file + message -> Returns Task ID
     GET /{id}/: Check status (polling)
+    GET /{id}/events/: Status pushed as Server-Sent Events (no polling)
+    GET /{id}/download/: Processed file as an attachment
     """
 
     queryset = AudioTask.objects.all()
     serializer_class = AudioTaskSerializer
     parser_classes = (MultiPartParser, FormParser)
+
+    def perform_create(self, serializer):
+        instance = serializer.save()
+        # Dispatch once the row is committed: the worker can never look it up too early
+        task_id = str(instance.id)
+        transaction.on_commit(lambda: process_stego_task.delay(task_id))
+
+    @action(detail=True, methods=["get"], renderer_classes=[EventStreamRenderer])
+    def events(self, request, pk=None):
+        task = self.get_object()
+
+        def snapshot():
+            # Re-read only when a status change was published (not on a timer)
+            task.refresh_from_db()
+            data = self.get_serializer(task).data
+            # Do not hold a database connection while the stream waits on Redis (reopened on demand)
+            connection.close()
+            return data
+
+        response = StreamingHttpResponse(status_events(task.id, snapshot), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Disable proxy buffering (nginx) so events are delivered immediately
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @action(detail=True, methods=["get"], content_negotiation_class=IgnoreClientContentNegotiation)
+    def download(self, request, pk=None):
+        task = self.get_object()
+        if not task.processed_file:
+            raise NotFound("No processed file for this task yet.")
+
+        # FileResponse hands the open file to the WSGI server (wsgi.file_wrapper -> sendfile),
+        # so the bytes are not copied through Python
+        return FileResponse(
+            task.processed_file.open("rb"), as_attachment=True, filename=Path(task.processed_file.name).name
+        )
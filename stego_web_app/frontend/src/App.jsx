@@ -17,32 +17,52 @@ function App() {
     // Mode: 'ENCODE' or 'DECODE'
     const [mode, setMode] = useState('ENCODE');
 
-    // Poll for status
+    // Status pushed by the server (Server-Sent Events) instead of polling
     useEffect(() => {
-        if (!taskId || status === 'COMPLETED' || status === 'ERROR') return;
+        if (!taskId) return;
 
-        const interval = setInterval(async () => {
+        // One stream per task: it closes itself once a terminal status arrives
+        const source = new EventSource(`${API_Base}/tasks/${taskId}/events/`);
+
+        // Applies a task snapshot; returns true once the task reached a terminal status
+        const applyStatus = (data) => {
+            setStatus(data.task_status);
+            if (data.task_status === 'COMPLETED') {
+                if (data.task_type === 'ENCODE') {
+                    setResultUrl(data.processed_file);
+                } else {
+                    setExtractedMessage(data.hidden_message);
+                }
+                return true;
+            } else if (data.task_status === 'ERROR') {
+                setErrorMsg(data.error_message || 'Unknown error occurred');
+                return true;
+            }
+            return false;
+        };
+
+        source.onmessage = (event) => {
+            if (applyStatus(JSON.parse(event.data))) {
+                source.close();
+            }
+        };
+
+        // EventSource reconnects by itself after network errors; meanwhile read the status
+        // once, so a stream that cannot be (re)opened never hides the final result
+        source.onerror = async (err) => {
+            console.error("Status stream error", err);
             try {
                 const res = await fetch(`${API_Base}/tasks/${taskId}/`);
-                const data = await res.json();
-
-                setStatus(data.task_status);
-                if (data.task_status === 'COMPLETED') {
-                    if (data.task_type === 'ENCODE') {
-                        setResultUrl(data.processed_file);
-                    } else {
-                        setExtractedMessage(data.hidden_message);
-                    }
-                } else if (data.task_status === 'ERROR') {
-                    setErrorMsg(data.error_message || 'Unknown error occurred');
+                if (res.ok && applyStatus(await res.json())) {
+                    source.close();
                 }
-            } catch (err) {
-                console.error("Polling error", err);
+            } catch (fetchErr) {
+                console.error("Status fetch error", fetchErr);
             }
-        }, 2000);
+        };
 
-        return () => clearInterval(interval);
-    }, [taskId, status, extractedMessage]);
+        return () => source.close();
+    }, [taskId]);
 
     const handleFileChange = (e) => {
         if (e.target.files && e.target.files[0]) {
@@ -68,39 +88,25 @@ function App() {
         }
     };
 
-    const handleDownload = async (e) => {
+    const handleDownload = (e) => {
         e.preventDefault();
-        if (!resultUrl) return;
+        if (!resultUrl || !taskId) return;
 
-        try {
-            // Construct absolute URL using API_Base
-            // This correctly resolves /media/... against the API domain
-            let urlStr = resultUrl.startsWith('http') ? resultUrl : new URL(resultUrl, API_Base).href;
-
-            // Fix Mixed Content: If we are on HTTPS, ensure the download URL is also HTTPS
-            if (window.location.protocol === 'https:' && urlStr.startsWith('http:')) {
-                urlStr = urlStr.replace('http:', 'https:');
-            }
-
-            const response = await fetch(urlStr);
-            if (!response.ok) throw new Error('Download failed');
+        // The download endpoint answers with Content-Disposition: attachment:
+        // the browser saves the file directly (no full copy held in a JS Blob)
+        let urlStr = `${API_Base}/tasks/${taskId}/download/`;
 
-            const blob = await response.blob();
-            const blobUrl = window.URL.createObjectURL(blob);
-
-            // Create temp link to force download
-            const link = document.createElement('a');
-            link.href = blobUrl;
-            link.download = urlStr.split('/').pop() || 'stego_audio.wav';
-            document.body.appendChild(link);
-            link.click();
-            document.body.removeChild(link);
-            window.URL.revokeObjectURL(blobUrl);
-        } catch (err) {
-            console.error("Download error:", err);
-            setErrorMsg("Failed to download file: " + err.message);
-            // Don't set status to ERROR here to keep the completed state visible
+        // Fix Mixed Content: If we are on HTTPS, ensure the download URL is also HTTPS
+        if (window.location.protocol === 'https:' && urlStr.startsWith('http:')) {
+            urlStr = urlStr.replace('http:', 'https:');
         }
+
+        // Create temp link to force download
+        const link = document.createElement('a');
+        link.href = urlStr;
+        document.body.appendChild(link);
+        link.click();
+        document.body.removeChild(link);
     };
 
     const handleSubmit = async (e) => {
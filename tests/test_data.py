@@ -1,5 +1,6 @@
 import struct
 import unittest
+from unittest.mock import patch
 
 from sonictag.data import ReedSolomonError, SonicDataHandler
 
@@ -14,6 +15,17 @@ class TestSonicDataHandler(unittest.TestCase):
         decoded = self.handler.decode(encoded)
         self.assertEqual(payload, decoded)
 
+    def test_intact_packet_skips_rs_decode(self):
+        """Test that a packet with a valid CRC is returned without running RS decoding."""
+        # Longer than one RS block (255 bytes) to check multi-block stripping
+        payload = bytes(range(256)) * 3
+        encoded = self.handler.encode(payload)
+
+        with patch.object(self.handler.rsc, "decode", side_effect=AssertionError("RS decode called")):
+            decoded = self.handler.decode(encoded)
+
+        self.assertEqual(payload, decoded)
+
     def test_error_correction(self):
         payload = b"Robust Communication"
         encoded = bytearray(self.handler.encode(payload))
@@ -76,3 +88,19 @@ class TestSonicDataHandler(unittest.TestCase):
         # Only provide 10 bytes
         with self.assertRaisesRegex(ValueError, "Incomplete packet"):
             self.handler.decode(header + b"x" * 10)
+
+    def test_codec_unaffected_by_other_handlers(self):
+        """Test that handlers with another ec_bytes leave encoding and error correction unchanged."""
+        payload = b"Hello, SonicTag!"
+        before = self.handler.encode(payload)
+
+        SonicDataHandler(ec_bytes=12).encode(payload)
+        other = SonicDataHandler(ec_bytes=10)
+
+        self.assertEqual(self.handler.encode(payload), before)
+        self.assertEqual(other.encode(payload), before)
+
+        # Corrupted payload byte: still corrected by the other handler's codec
+        corrupted = bytearray(before)
+        corrupted[-15] ^= 0xFF
+        self.assertEqual(other.decode(bytes(corrupted)), payload)
@@ -42,7 +42,8 @@ def test_noisy_loopback(transceiver):
     audio_frame = tx.create_audio_frame(payload)
 
     # Add Gaussian Noise (sigma=0.1 is significant noise)
-    noise = np.random.normal(0, 0.1, len(audio_frame))
+    rng = np.random.default_rng(0)
+    noise = rng.standard_normal(len(audio_frame), dtype=np.float32) * 0.1
     noisy_frame = audio_frame + noise
 
     # Pad
@@ -8,23 +8,26 @@ from sonictag.ofdm import SonicOFDM
 class TestSonicOFDM(unittest.TestCase):
     def setUp(self):
         self.ofdm = SonicOFDM(n_fft=128, cp_len=16, start_freq=1000, end_freq=2000)
+        self.rng = np.random.default_rng(0)
 
     def test_modulation_demodulation_loopback(self):
         # Create random bits
         n_bits = self.ofdm.bits_per_symbol * 5  # 5 symbols worth
-        original_bits = np.random.randint(0, 2, n_bits)
+        original_bits = self.rng.integers(0, 2, n_bits)
 
         # Modulate
         signal = self.ofdm.modulate(original_bits)
 
         # Check signal properties
         self.assertTrue(np.max(np.abs(signal)) <= 1.0)
+        self.assertEqual(signal.dtype, np.float32)
 
         # Demodulate (Ideal Loopback)
         decoded_bits = self.ofdm.demodulate(signal)
 
         # In ideal loopback, bits should match perfectly
         np.testing.assert_array_equal(original_bits, decoded_bits)
+        self.assertEqual(decoded_bits.dtype, np.uint8)
 
     def test_bit_byte_conversion(self):
         payload = b"Test"
@@ -54,3 +57,15 @@ class TestSonicOFDM(unittest.TestCase):
 
         bits = self.ofdm.demodulate(short_signal)
         self.assertEqual(len(bits), 0)
+
+    def test_modulation_unaffected_by_other_instances(self):
+        """Test that building modulators with another layout leaves modulation unchanged."""
+        bits = self.rng.integers(0, 2, self.ofdm.bits_per_symbol * 3)
+        before = self.ofdm.modulate(bits)
+
+        SonicOFDM(n_fft=256, cp_len=32, start_freq=1500, end_freq=3000).modulate(bits)
+        other = SonicOFDM(n_fft=128, cp_len=16, start_freq=1000, end_freq=2000)
+
+        np.testing.assert_array_equal(self.ofdm.modulate(bits), before)
+        np.testing.assert_array_equal(other.modulate(bits), before)
+        np.testing.assert_array_equal(other.demodulate(before), bits)
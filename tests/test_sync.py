@@ -1,13 +1,17 @@
 import unittest
+from unittest.mock import patch
 
 import numpy as np
+from scipy import signal as sp_signal
 
+from sonictag import sync as sync_module
 from sonictag.sync import SonicSync
 
 
 class TestSonicSync(unittest.TestCase):
     def setUp(self):
         self.sync = SonicSync(duration=0.01)
+        self.rng = np.random.default_rng(0)
 
     def test_preamble_generation(self):
         preamble = self.sync.generate_preamble()
@@ -38,13 +42,13 @@ class TestSonicSync(unittest.TestCase):
     def test_detection_with_emergence(self):
         # Test just preamble
         preamble = self.sync.generate_preamble()
-        noise = np.random.normal(0, 0.05, 1000)
+        noise = self.rng.standard_normal(1000, dtype=np.float32) * 0.05
         signal = noise
 
         # Inject faint preamble
         preamble = self.sync.generate_preamble() * 0.005
-        noise_before = np.random.normal(0, 0.0001, 100)
-        noise_after = np.random.normal(0, 0.0001, 200)
+        noise_before = self.rng.standard_normal(100, dtype=np.float32) * 0.0001
+        noise_after = self.rng.standard_normal(200, dtype=np.float32) * 0.0001
         signal = np.concatenate([noise_before, preamble, noise_after])
 
         start_idx = self.sync.detect(signal)
@@ -72,7 +76,7 @@ class TestSonicSync(unittest.TestCase):
         # To fail detection (min_peak=4.0), we need factor < 4/240 ~ 0.016
         # Let's use 0.01
 
-        noise = np.random.normal(0, 0.001, 1000)
+        noise = self.rng.standard_normal(1000, dtype=np.float32) * 0.001
         signal = noise
         # Inject faint preamble
         # Peak response is ~240 * scale.
@@ -85,3 +89,74 @@ class TestSonicSync(unittest.TestCase):
         # Should fail detect due to low peak (<0.3)
         idx = self.sync.detect(signal, min_peak=4.0)
         self.assertEqual(idx, -1)
+
+    def test_fft_correlation_matches_direct(self):
+        """Test that the cached FFT correlation matches scipy's direct correlation."""
+        audio = self.rng.normal(0, 0.1, 5000)
+
+        expected = sp_signal.correlate(audio, self.sync.preamble, mode="valid", method="direct")
+
+        # Run twice: second call reuses the cached preamble spectrum
+        for _ in range(2):
+            corr = self.sync._correlate(audio)
+            np.testing.assert_allclose(corr, expected, atol=1e-9)
+
+        # Chunks spanning one or several overlap-save tiles
+        build = patch.object(sync_module, "_build_preamble_spectrum", wraps=sync_module._build_preamble_spectrum)
+        with build as build_spectrum:
+            for n in [1000, 8192, 8193, 20000, 48000]:
+                chunk = self.rng.normal(0, 0.1, n)
+                expected = sp_signal.correlate(chunk, self.sync.preamble, mode="valid", method="direct")
+                np.testing.assert_allclose(self.sync._correlate(chunk), expected, atol=1e-9)
+
+        # Only a few power-of-two tile sizes are ever requested
+        blocks = {call.args[4] for call in build_spectrum.call_args_list}
+        self.assertLessEqual(len(blocks), 4)
+        for block in blocks:
+            self.assertLessEqual(block, self.sync._block_size)
+
+    def test_fft_correlation_single_precision(self):
+        """Test that float32 input is correlated in single precision."""
+        audio = self.rng.normal(0, 0.1, 5000)
+
+        expected = self.sync._correlate(audio)
+        corr = self.sync._correlate(audio.astype(np.float32))
+
+        self.assertEqual(corr.dtype, np.float32)
+        np.testing.assert_allclose(corr, expected, atol=1e-4)
+
+    def test_correlation_unaffected_by_other_instances(self):
+        """Test that building a differently configured instance leaves the correlation unchanged."""
+        audio = self.rng.normal(0, 0.1, 20000)
+        before = self.sync._correlate(audio)
+
+        # Same sample rate and tile sizes, different chirp
+        SonicSync(start_freq=17000, end_freq=18000, duration=0.01)._correlate(audio)
+
+        np.testing.assert_array_equal(self.sync._correlate(audio), before)
+        np.testing.assert_array_equal(SonicSync(duration=0.01)._correlate(audio), before)
+
+    def test_direct_correlation_short_search(self):
+        """Test the direct path used when the chunk is barely longer than the preamble."""
+        audio = self.rng.normal(0, 0.1, len(self.sync.preamble) + 50)
+
+        preamble = self.sync.preamble.astype(np.float64)
+        expected = sp_signal.correlate(audio, preamble, mode="valid", method="fft")
+        with patch.object(sync_module.fft, "rfft") as rfft:
+            corr = self.sync._correlate(audio)
+
+        np.testing.assert_allclose(corr, expected, atol=1e-9)
+        rfft.assert_not_called()
+
+    def test_detection_unaffected_by_other_instances(self):
+        """Test that building differently configured instances leaves detection unchanged."""
+        preamble = self.sync.generate_preamble().copy()
+        signal = np.concatenate([np.zeros(100), preamble, np.zeros(200)])
+
+        SonicSync(start_freq=17000, end_freq=18000, duration=0.02).detect(signal)
+        other = SonicSync(duration=0.01)
+
+        np.testing.assert_array_equal(self.sync.generate_preamble(), preamble)
+        np.testing.assert_array_equal(other.generate_preamble(), preamble)
+        self.assertEqual(self.sync.generate_preamble().dtype, np.float32)
+        self.assertAlmostEqual(other.detect(signal), 100, delta=1)
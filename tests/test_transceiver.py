@@ -12,6 +12,7 @@ class TestTransceiver(unittest.TestCase):
         self.fs = 48000
         self.tx = SonicTransmitter(sample_rate=self.fs)
         self.rx = SonicReceiver(sample_rate=self.fs)
+        self.rng = np.random.default_rng(0)
 
     def test_create_audio_frame_structure(self):
         """Test physical properties of the generated frame."""
@@ -20,6 +21,7 @@ class TestTransceiver(unittest.TestCase):
 
         # Check normalization (max amplitude <= 1.0)
         self.assertLessEqual(np.max(np.abs(frame)), 1.0)
+        self.assertEqual(frame.dtype, np.float32)
 
         # Check fade in/out (start and end should be near 0)
         self.assertAlmostEqual(frame[0], 0, delta=0.1)
@@ -61,7 +63,7 @@ class TestTransceiver(unittest.TestCase):
 
     def test_decode_noise(self):
         """Test decoding random noise returns nothing."""
-        noise = np.random.normal(0, 0.01, 48000).astype(np.float32)
+        noise = self.rng.standard_normal(48000, dtype=np.float32) * 0.01
         decoded, consumed = self.rx.decode_frame(noise)
         self.assertIsNone(decoded)
         self.assertGreaterEqual(consumed, 0)